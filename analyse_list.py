@@ -1,5 +1,16 @@
 import json
 
+# Optional: orjson zum schnelleren Einlesen der Benchmark-Liste
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Zeilenformat der Ausgabetabelle; die Genauigkeitsangabe (.N) kürzt zu lange Felder
+FMT = "{:<15} {:<50.50} {:<15} {:<15} {:<30.30} {:<50.50}\n".format
+# Platzhalter für fehlende Listen (Tupel, damit pro Zeile keine neue Liste angelegt wird)
+_NA = ('N/A',)
+
 def analyse_benchmarks(dateiname):
     """
     Analysiert die Benchmark-Datei und erstellt eine Tabelle mit den wichtigsten Informationen.
@@ -11,52 +22,52 @@ def analyse_benchmarks(dateiname):
         bool: True bei Erfolg, False bei Fehlern
     """
     try:
-        # Benchmark-Daten aus Datei laden
-        with open(dateiname, 'r', encoding='utf-8') as datei:
-            benchmarks_daten = json.load(datei)
+        # Benchmark-Daten in einem Stück als Bytes laden, ohne den Umweg über die Text-Dekodierung
+        with open(dateiname, 'rb') as datei:
+            rohdaten = datei.read()
+        if orjson:
+            benchmarks_daten = orjson.loads(rohdaten)
+        else:
+            benchmarks_daten = json.loads(rohdaten.decode('utf-8'))
         
         # Überprüfen, ob die erforderliche Struktur vorhanden ist
         if 'Benchmarks' not in benchmarks_daten:
             print(f"Fehler: Ungültiges Dateiformat - 'Benchmarks' Feld fehlt in {dateiname}")
             return False
         
-        # Ausgabedatei öffnen
-        with open('benchmarks.txt', 'w', encoding='utf-8') as ausgabe:
-            # Tabellenkopf schreiben
-            ausgabe.write(f"{'workbenchId':<15} {'benchmarkTitle':<50} {'benchmarkVersion':<15} "
-                         f"{'assessmentStatus':<15} {'availableFormats':<30} {'profiles':<50}\n")
-            ausgabe.write('-' * 175 + '\n')
+        # Tabellenkopf
+        zeilen = [
+            FMT('workbenchId', 'benchmarkTitle', 'benchmarkVersion',
+                'assessmentStatus', 'availableFormats', 'profiles'),
+            '-' * 175 + '\n'
+        ]
+        
+        # Manuelle Benchmarks vorab aussortieren, bevor Felder extrahiert werden
+        benchmarks = [b for b in benchmarks_daten['Benchmarks'] if b.get('assessmentStatus') != 'Manual']
+        
+        # Durch alle übrigen Benchmarks iterieren und Daten extrahieren
+        for benchmark in benchmarks:
+            # Extrahieren der benötigten Felder
+            workbench_id = benchmark.get('workbenchId', 'N/A')
+            title = benchmark.get('benchmarkTitle', 'N/A')
+            version = benchmark.get('benchmarkVersion', 'N/A')
+            status = benchmark.get('assessmentStatus', 'N/A')
             
-            # Durch alle Benchmarks iterieren und Daten extrahieren
-            for benchmark in benchmarks_daten['Benchmarks']:
-                # Extrahieren der benötigten Felder
-                workbench_id = benchmark.get('workbenchId', 'N/A')
-                title = benchmark.get('benchmarkTitle', 'N/A')
-                version = benchmark.get('benchmarkVersion', 'N/A')
-                status = benchmark.get('assessmentStatus', 'N/A')
-                if status == 'Manual':
-                    continue
-                
-                # Formate als kommagetrennte Liste
-                formats = ', '.join(benchmark.get('availableFormats', ['N/A']))
-                
-                # Profile-Titel extrahieren
-                profile_titles = []
-                for profile in benchmark.get('profiles', []):
-                    if 'profileTitle' in profile:
-                        profile_titles.append(profile['profileTitle'])
-                
-                # Wenn keine Profile vorhanden sind
-                if not profile_titles:
-                    profile_titles = ['N/A']
-                
-                # Profile als kommagetrennte Liste
-                profiles = ', '.join(profile_titles)
-                
-                # Zeile in Tabelle schreiben (mit Kürzung für bessere Lesbarkeit)
-                ausgabe.write(f"{workbench_id:<15} {title[:47]+'...' if len(title)>50 else title:<50} "
-                             f"{version:<15} {status:<15} {formats[:27]+'...' if len(formats)>30 else formats:<30} "
-                             f"{profiles[:47]+'...' if len(profiles)>50 else profiles:<50}\n")
+            # Formate als kommagetrennte Liste
+            formats = ', '.join(benchmark.get('availableFormats') or _NA)
+            
+            # Profile-Titel extrahieren ('N/A', wenn keine Profile vorhanden sind)
+            profile_titles = [p['profileTitle'] for p in benchmark.get('profiles', ()) if 'profileTitle' in p] or _NA
+            
+            # Profile als kommagetrennte Liste
+            profiles = ', '.join(profile_titles)
+            
+            # Zeile für die Tabelle (FMT kürzt zu lange Felder für bessere Lesbarkeit)
+            zeilen.append(FMT(workbench_id, title, version, status, formats, profiles))
+        
+        # Alle Zeilen gesammelt in die Ausgabedatei schreiben
+        with open('benchmarks.txt', 'w', encoding='utf-8', buffering=1 << 20) as ausgabe:
+            ausgabe.writelines(zeilen)
         
         print("Analyse abgeschlossen. Ergebnisse wurden in 'benchmarks.txt' gespeichert.")
         return True
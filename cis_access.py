@@ -1,19 +1,52 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import tempfile
+import threading
+
+# Optional: orjson zum Prüfen und Serialisieren der Benchmark-Liste und des Tokens
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Basis-URL für die SecureSuite Member API
 BASE_URL = "https://workbench.cisecurity.org/api/vendor/v1"
 LICENSE_ENDPOINT = "/license"
+LICENSE_FILE = "license.xml"
 TOKEN_FILE = "securesuite_token.json"
 BENCHMARK_LIST = "available_benchmarks.json"
+# Begleitdatei mit ETag/Last-Modified der gespeicherten Benchmark-Liste
+BENCHMARK_LIST_META = "available_benchmarks.meta.json"
+# Zeitraum in Sekunden, in dem eine erfolgreiche Servervalidierung wiederverwendet wird
+TOKEN_VERIFY_TTL = 300
+
+# Gemeinsame HTTP-Session, damit TCP- und TLS-Verbindungen wiederverwendet werden
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+SESSION.headers.update({"Accept-Encoding": "gzip"})
+
+# Zwischenspeicher für die geladene Token-Datei, gültig solange Inode, Änderungszeit und Größe gleich bleiben
+_TOKEN_CACHE = {'key': None, 'info': None}
+
+# Zwischenspeicher erfolgreich gelesener Lizenzdateien: Pfad -> ((mtime, Größe), (Inhalt, Content-Type))
+_LIZENZ_CACHE = {}
 
 
 def lizenz_aus_datei_lesen(dateipfad):
     """
     Liest den SecureSuite-Lizenzschlüssel aus einer Datei (XML oder JSON).
+    Erfolgreich gelesene Dateien werden zwischengespeichert, solange sie sich nicht ändern;
+    Fehlschläge werden nicht zwischengespeichert.
     
     Args:
         dateipfad (str): Pfad zur Datei mit dem Lizenzschlüssel
@@ -23,6 +56,12 @@ def lizenz_aus_datei_lesen(dateipfad):
         str: Der Content-Type ('application/xml' oder 'application/json')
     """
     try:
+        stat = os.stat(dateipfad)
+        key = (stat.st_mtime_ns, stat.st_size)
+        eintrag = _LIZENZ_CACHE.get(dateipfad)
+        if eintrag and eintrag[0] == key:
+            return eintrag[1]
+        
         with open(dateipfad, 'r') as datei:
             inhalt = datei.read()
             
@@ -41,6 +80,7 @@ def lizenz_aus_datei_lesen(dateipfad):
                 print("Warnung: Konnte Content-Type nicht bestimmen, verwende 'application/xml'")
                 content_type = 'application/xml'
         
+        _LIZENZ_CACHE[dateipfad] = (key, (inhalt, content_type))
         return inhalt, content_type
     except FileNotFoundError:
         print(f"Fehler: Lizenzdatei wurde nicht gefunden unter {dateipfad}")
@@ -63,7 +103,7 @@ def neues_token_abrufen(lizenzschluessel, content_type='application/xml'):
     url = BASE_URL + LICENSE_ENDPOINT
     
     try:
-        response = requests.post(url, data=lizenzschluessel, headers={'Content-Type': content_type})
+        response = SESSION.post(url, data=lizenzschluessel, headers={'Content-Type': content_type})
         
         # Überprüfen auf HTTP-Fehler
         if response.status_code != 200:
@@ -82,9 +122,11 @@ def neues_token_abrufen(lizenzschluessel, content_type='application/xml'):
             # Berechnung der Ablaufzeit (20 Minuten ab jetzt)
             ablaufzeit = datetime.now() + timedelta(minutes=20)
             
+            # Ein frisch ausgestelltes Token gilt als serverseitig validiert
             token_info = {
                 'token': token_daten['token'],
-                'expires_at': ablaufzeit.timestamp()
+                'expires_at': ablaufzeit.timestamp(),
+                'verified_at': datetime.now().timestamp()
             }
             
             # Token in Datei speichern
@@ -100,16 +142,30 @@ def neues_token_abrufen(lizenzschluessel, content_type='application/xml'):
 
 def token_speichern(token_info):
     """
-    Speichert die Token-Informationen in einer Datei.
+    Speichert die Token-Informationen in einer Datei. Es wird zunächst in eine temporäre
+    Datei geschrieben und diese dann umbenannt, damit ein Abbruch keine halb geschriebene
+    Token-Datei hinterlässt.
     
     Args:
         token_info (dict): Dictionary mit dem Token und seiner Ablaufzeit
     """
+    tmp_datei = None
     try:
-        with open(TOKEN_FILE, 'w') as datei:
-            json.dump(token_info, datei)
+        if orjson:
+            inhalt = orjson.dumps(token_info)
+        else:
+            inhalt = json.dumps(token_info).encode('utf-8')
+        
+        fd, tmp_datei = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(TOKEN_FILE)), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as datei:
+            datei.write(inhalt)
+            datei.flush()
+            os.fsync(datei.fileno())
+        os.replace(tmp_datei, TOKEN_FILE)
     except Exception as e:
         print(f"Warnung: Konnte Token nicht speichern: {e}")
+        if tmp_datei and os.path.exists(tmp_datei):
+            os.remove(tmp_datei)
 
 def token_ueberpruefen(token):
     """
@@ -125,7 +181,7 @@ def token_ueberpruefen(token):
     headers = {"X-SecureSuite-Token": token}
     
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
         
         # HTTP-Statuscode Analyse
         if response.status_code == 200:
@@ -149,15 +205,24 @@ def token_ueberpruefen(token):
 
 def token_laden():
     """
-    Lädt die Token-Informationen aus einer Datei.
+    Lädt die Token-Informationen aus einer Datei. Solange sich die Datei nicht geändert hat,
+    wird das bereits geladene Ergebnis wiederverwendet.
     
     Returns:
         dict: Dictionary mit dem Token und seiner Ablaufzeit oder None, wenn nicht gefunden
     """
     try:
         if os.path.exists(TOKEN_FILE):
+            # token_speichern ersetzt die Datei per os.replace, jede Speicherung erhält also eine neue Inode
+            stat = os.stat(TOKEN_FILE)
+            key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if _TOKEN_CACHE['info'] is not None and _TOKEN_CACHE['key'] == key:
+                return _TOKEN_CACHE['info']
             with open(TOKEN_FILE, 'r') as datei:
-                return json.load(datei)
+                token_info = json.load(datei)
+            _TOKEN_CACHE['key'] = key
+            _TOKEN_CACHE['info'] = token_info
+            return token_info
         return None
     except Exception as e:
         print(f"Warnung: Konnte Token nicht laden: {e}")
@@ -165,7 +230,9 @@ def token_laden():
 
 def ist_token_gueltig(token_info):
     """
-    Kombinierte Gültigkeitsprüfung mit lokaler Zeitprüfung und Servervalidierung
+    Kombinierte Gültigkeitsprüfung mit lokaler Zeitprüfung und Servervalidierung.
+    Eine erfolgreiche Servervalidierung wird für TOKEN_VERIFY_TTL Sekunden
+    wiederverwendet, um die zusätzliche Anfrage an /token/check zu sparen.
     
     Args:
         token_info (dict): Gespeicherte Token-Informationen
@@ -177,11 +244,30 @@ def ist_token_gueltig(token_info):
     if not token_info or 'expires_at' not in token_info:
         return False
         
-    if datetime.now().timestamp() > token_info['expires_at'] - 30:
+    jetzt = datetime.now().timestamp()
+    if jetzt > token_info['expires_at'] - 30:
         return False
     
+    # Zwischengespeicherte Servervalidierung
+    verified_at = token_info.get('verified_at')
+    if verified_at and jetzt - verified_at < TOKEN_VERIFY_TTL:
+        return True
+    
     # Serverseitige Validierung
-    return token_ueberpruefen(token_info['token'])
+    gueltig = token_ueberpruefen(token_info['token'])
+    if gueltig:
+        token_info['verified_at'] = jetzt
+        token_speichern(token_info)
+    return gueltig
+
+def token_validierung_verwerfen():
+    """
+    Verwirft die zwischengespeicherte Servervalidierung, sodass das Token
+    bei der nächsten Prüfung wieder serverseitig überprüft wird.
+    """
+    token_info = token_laden()
+    if token_info and token_info.pop('verified_at', None) is not None:
+        token_speichern(token_info)
 
 def token_abrufen(lizenz_dateipfad=None, force_refresh=False):
     """
@@ -214,9 +300,52 @@ def token_abrufen(lizenz_dateipfad=None, force_refresh=False):
     print("Fehler: Es konnte kein gültiges Token abgerufen werden")
     return None
 
-def list_available_benchmarks(ausfuehrlich=False, token=None):
+def benchmark_liste_metadaten_laden():
+    """
+    Lädt ETag und Last-Modified der zuletzt gespeicherten Benchmark-Liste.
+    
+    Returns:
+        dict: Dictionary mit 'etag' und 'last_modified' oder None, wenn keine lokale Liste existiert
+    """
+    if not os.path.exists(BENCHMARK_LIST) or not os.path.exists(BENCHMARK_LIST_META):
+        return None
+    try:
+        with open(BENCHMARK_LIST_META, 'r') as datei:
+            metadaten = json.load(datei)
+    except Exception as e:
+        print(f"Warnung: Konnte Metadaten der Benchmark-Liste nicht laden: {e}")
+        return None
+    
+    # Beschädigte oder von Hand veränderte Begleitdatei ignorieren
+    if not isinstance(metadaten, dict):
+        print(f"Warnung: Ungültiges Format der Metadaten in {BENCHMARK_LIST_META}, ignoriere sie")
+        return None
+    return metadaten
+
+def benchmark_liste_metadaten_speichern(response):
+    """
+    Speichert ETag und Last-Modified einer Antwort für spätere bedingte Anfragen.
+    
+    Args:
+        response (requests.Response): Antwort des Benchmark-Endpunkts
+    """
+    metadaten = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified')
+    }
+    try:
+        with open(BENCHMARK_LIST_META, 'w') as datei:
+            json.dump(metadaten, datei)
+    except Exception as e:
+        print(f"Warnung: Konnte Metadaten der Benchmark-Liste nicht speichern: {e}")
+
+def list_available_benchmarks(ausfuehrlich=False, token=None, formatiert=False):
     """
     Ruft alle verfügbaren Benchmarks ab und verwendet dabei bei Bedarf ein Authentifizierungstoken.
+    Die Liste wird kompakt gespeichert; mit formatiert=True wird sie eingerückt und damit
+    für Menschen lesbar geschrieben. Existiert bereits eine lokale Liste, wird bedingt
+    abgefragt (If-None-Match/If-Modified-Since), sodass unveränderte Daten nicht erneut
+    übertragen werden.
     Response Element
 
     Description
@@ -284,11 +413,26 @@ def list_available_benchmarks(ausfuehrlich=False, token=None):
         # Automatischen Token-Abruf nur bei erforderlichen Endpunkten
         pass  # Dieser Endpunkt ist öffentlich und benötigt kein Token
     
+    # Bedingte Anfrage, falls eine lokale Liste mit Metadaten vorhanden ist; bei formatiert=True
+    # wird die Liste immer neu geschrieben, da die lokale Datei kompakt sein kann
+    metadaten = None if formatiert else benchmark_liste_metadaten_laden()
+    if metadaten:
+        if metadaten.get('etag'):
+            headers["If-None-Match"] = metadaten['etag']
+        if metadaten.get('last_modified'):
+            headers["If-Modified-Since"] = metadaten['last_modified']
+    
     try:
         if ausfuehrlich:
             print(f"Starte Benchmark-Abruf von: {url}")
             
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
+        
+        # Liste unverändert - lokale Datei weiterverwenden
+        if response.status_code == 304:
+            if ausfuehrlich:
+                print(f"Benchmark-Liste unverändert, verwende lokale Datei: {speicherdatei}")
+            return True
         
         # HTTP-Statuscode Validierung
         if response.status_code != 200:
@@ -299,7 +443,11 @@ def list_available_benchmarks(ausfuehrlich=False, token=None):
                 
         # JSON-Verarbeitung mit erweiterter Fehlerbehandlung
         try:
-            benchmarks_daten = response.json()
+            # Das Parsen dient nur der Validierung, gespeichert wird die unveränderte Antwort
+            if orjson:
+                benchmarks_daten = orjson.loads(response.content)
+            else:
+                benchmarks_daten = response.json()
             
             # Validierung der Antwortstruktur
             if 'Benchmarks' not in benchmarks_daten:
@@ -314,8 +462,19 @@ def list_available_benchmarks(ausfuehrlich=False, token=None):
             
         # Speicherung der Daten mit Versionierung
         try:
-            with open(speicherdatei, 'w', encoding='utf-8') as datei:
-                json.dump(benchmarks_daten, datei, indent=2, ensure_ascii=False)
+            if not formatiert:
+                inhalt = response.content
+            elif orjson:
+                inhalt = orjson.dumps(benchmarks_daten, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            else:
+                inhalt = json.dumps(benchmarks_daten, indent=2, ensure_ascii=False).encode('utf-8')
+            
+            # Alte Metadaten zuerst entfernen, damit eine abgebrochene Speicherung nicht per 304 bestehen bleibt
+            if os.path.exists(BENCHMARK_LIST_META):
+                os.remove(BENCHMARK_LIST_META)
+            with open(speicherdatei, 'wb') as datei:
+                datei.write(inhalt)
+            benchmark_liste_metadaten_speichern(response)
                 
             if ausfuehrlich:
                 print(f"Erfolgreich gespeichert: {speicherdatei}")
@@ -337,61 +496,175 @@ def list_available_benchmarks(ausfuehrlich=False, token=None):
         print(f"Kritischer Fehler: {e}")
         return False
         
-def handle_error(response):
+def handle_error(response, lizenz_dateipfad=LICENSE_FILE):
     """Behandelt Authentifizierungsfehler mit automatischem Token-Refresh"""
     if response.status_code == 401:
         print("Token ungültig/abgelaufen - Versuche Token-Refresh...")
-        new_token = token_abrufen(force_refresh=True)
+        token_validierung_verwerfen()
+        _LIZENZ_CACHE.clear()
+        new_token = token_abrufen(lizenz_dateipfad, force_refresh=True)
         if new_token:
             return {'token': new_token, 'retry': True}
     return {'error': 'Permanent authentication failure'}
 
+def token_erneuern(response, gesendetes_token, token_halter=None):
+    """
+    Erneuert das Token nach einem 401. Parallele Downloads teilen sich über token_halter
+    ein einziges Refresh: wer nach einem anderen Thread dran ist, übernimmt dessen Token.
+    
+    Args:
+        response (requests.Response): Die Antwort mit Status-Code 401
+        gesendetes_token (str): Das Token, mit dem die fehlgeschlagene Anfrage gesendet wurde
+        token_halter (dict, optional): Gemeinsames {'token', 'lock', 'fehler'} mehrerer Threads
+        
+    Returns:
+        dict: Ergebnis wie bei handle_error
+    """
+    if token_halter is None:
+        return handle_error(response)
+    
+    with token_halter['lock']:
+        if token_halter['fehler']:
+            return {'error': 'Permanent authentication failure'}
+        # Ein anderer Thread hat das Token bereits erneuert
+        if token_halter['token'] != gesendetes_token:
+            return {'token': token_halter['token'], 'retry': True}
+        
+        ergebnis = handle_error(response)
+        if ergebnis.get('retry'):
+            token_halter['token'] = ergebnis['token']
+        else:
+            token_halter['fehler'] = True
+        return ergebnis
+
 def get_benchmark_details(workbench_id, token):
     """Holt detaillierte Metadaten unter Verwendung des Member-Tokens"""
     print(token)
     
     url = BASE_URL + f"/benchmarks/{workbench_id}"
-    headers = {"X-SecureSuite-Token": token}
-    
-    print(url, headers)
     
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 401:
-            token_abrufen(force_refresh=True)
-            return get_benchmark_details(workbench_id)
-        # return response.json()
-        print(response.json())
+        # Bei abgelaufenem Token einmalig mit erneuertem Token wiederholen
+        for versuch in range(2):
+            headers = {"X-SecureSuite-Token": token}
+            print(url, headers)
+            
+            response = SESSION.get(url, headers=headers)
+            if response.status_code == 401:
+                if versuch == 0:
+                    ergebnis = handle_error(response)
+                    if ergebnis.get('retry'):
+                        token = ergebnis['token']
+                        continue
+                print("Fehler: Authentifizierung fehlgeschlagen")
+                return None
+            # return response.json()
+            print(response.json())
+            return None
     except requests.exceptions.RequestException as e:
         print(f"Fehler bei der Anfrage: {e}")
         return None
 
-def download_benchmark(workbench_id, token):
+def download_benchmark(workbench_id, token, token_halter=None):
     """Holt detaillierte Metadaten unter Verwendung des Member-Tokens"""
     print(token)
     
     url = BASE_URL + f"/benchmarks/{workbench_id}/JSON"
-    headers = {
-        "X-SecureSuite-Token": token,
-        "Accept": "application/zip"
-    }
-    
-    print(url, headers)
+    tmp_datei = None
     
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 401:
-            token_abrufen(force_refresh=True)
-            return get_benchmark_details(workbench_id)
-        # return response.json()
-        filename = f"benchmark_{workbench_id}_{datetime.now().strftime('%Y%m%d')}"+".zip"
-        with open(filename, 'wb') as f:
-            f.write(response.content)
-        print(filename)
-        return filename
+        # Bei abgelaufenem Token einmalig mit erneuertem Token wiederholen
+        for versuch in range(2):
+            headers = {
+                "X-SecureSuite-Token": token,
+                "Accept": "application/zip"
+            }
+            print(url, headers)
+            
+            # ZIP-Archiv in Blöcken direkt auf die Platte schreiben, statt es komplett im Speicher zu halten
+            with SESSION.get(url, headers=headers, stream=True) as response:
+                if response.status_code == 401:
+                    if versuch == 0:
+                        ergebnis = token_erneuern(response, token, token_halter)
+                        if ergebnis.get('retry'):
+                            token = ergebnis['token']
+                            continue
+                    print("Fehler: Authentifizierung fehlgeschlagen")
+                    return None
+                # Fehlerantworten (z.B. 404 bei unbekannter ID) nicht als ZIP speichern
+                if response.status_code != 200:
+                    print(f"Fehler: API antwortete mit Status-Code {response.status_code} für Benchmark {workbench_id}")
+                    return None
+                filename = f"benchmark_{workbench_id}_{datetime.now().strftime('%Y%m%d')}"+".zip"
+                # Erst nach vollständiger Übertragung umbenennen, damit kein abgeschnittenes ZIP zurückbleibt
+                tmp_datei = filename + '.part'
+                with open(tmp_datei, 'wb', buffering=1 << 20) as f:
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        f.write(chunk)
+                os.replace(tmp_datei, filename)
+            print(filename)
+            return filename
     except requests.exceptions.RequestException as e:
         print(f"Fehler bei der Anfrage: {e}")
         return None
+    except OSError as e:
+        print(f"Dateizugriffsfehler beim Speichern von Benchmark {workbench_id}: {e}")
+        return None
+    finally:
+        if tmp_datei and os.path.exists(tmp_datei):
+            os.remove(tmp_datei)
+
+def download_benchmarks(workbench_ids, token, max_workers=8):
+    """
+    Lädt mehrere Benchmarks parallel herunter. Die Downloads sind voneinander unabhängig
+    und netzwerkgebunden, daher werden sie auf einen Thread-Pool verteilt. Doppelte IDs
+    werden nur einmal geladen, ein abgelaufenes Token wird für alle Threads nur einmal erneuert.
+    
+    Args:
+        workbench_ids (list): Liste der Benchmark-IDs
+        token (str): Das SecureSuite API-Token
+        max_workers (int, optional): Maximale Anzahl gleichzeitiger Downloads
+        
+    Returns:
+        list: Dateinamen der heruntergeladenen Benchmarks (None bei fehlgeschlagenen Downloads)
+    """
+    workbench_ids = list(dict.fromkeys(workbench_ids))
+    token_halter = {'token': token, 'lock': threading.Lock(), 'fehler': False}
+    
+    def herunterladen(workbench_id):
+        return download_benchmark(workbench_id, token_halter['token'], token_halter)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(herunterladen, workbench_ids))
+
+def ids_aus_datei_lesen(dateipfad):
+    """
+    Liest Benchmark-IDs zeilenweise aus einer Datei. Leere Zeilen werden ignoriert, IDs mit
+    Pfadtrennzeichen werden verworfen, da sie in URL und Dateinamen eingesetzt werden.
+    
+    Args:
+        dateipfad (str): Pfad zur Datei mit einer Benchmark-ID pro Zeile
+        
+    Returns:
+        list: Liste der Benchmark-IDs oder None, wenn die Datei nicht gelesen werden konnte
+    """
+    try:
+        with open(dateipfad, 'r') as datei:
+            zeilen = [zeile.strip() for zeile in datei if zeile.strip()]
+        
+        workbench_ids = []
+        for workbench_id in zeilen:
+            if '/' in workbench_id or '\\' in workbench_id:
+                print(f"Warnung: Ungültige Benchmark-ID wird übersprungen: {workbench_id}")
+                continue
+            workbench_ids.append(workbench_id)
+        return workbench_ids
+    except FileNotFoundError:
+        print(f"Fehler: ID-Liste wurde nicht gefunden unter {dateipfad}")
+        return None
+    except Exception as e:
+        print(f"Fehler beim Lesen der ID-Liste: {e}")
+        return None
 
 
 def main():
@@ -402,71 +675,54 @@ def main():
     # parse command line arguments, if --gettoken is provides it will get a new token
     # if --getbenchmarks is provided it will get the benchmarks list
     # if --download <benchmarkID> is provided it will download the benchmark with the given ID
+    # if --download-list <file> is provided it will download all benchmarks listed in the file in parallel
     # if --getdetails <benchmarkID> is provided it will get the details of the benchmark with the given ID
     # if --help is provided it will show the help message
     parser = argparse.ArgumentParser(description="SecureSuite Token und Benchmark Management")
     parser.add_argument('--gettoken', action='store_true', help="Fordert ein neues Token an und überprüft damit die Validität der Lizenz")
     parser.add_argument('--getbenchmarks', action='store_true', help="Ruft die Liste der verfügbaren Benchmarks ab")
     parser.add_argument('--download', type=str, help="Lädt den Benchmark mit der angegebenen ID herunter")
+    parser.add_argument('--download-list', type=str, help="Lädt alle Benchmarks parallel herunter, deren IDs zeilenweise in der angegebenen Datei stehen")
     parser.add_argument('--getdetails', type=str, help="Ruft die Details des Benchmarks mit der angegebenen ID ab")
+    parser.add_argument('--pretty', action='store_true', help="Speichert die Benchmark-Liste eingerückt (lesbar) statt kompakt")
     args = parser.parse_args()
     
     # Pfad zu Ihrer Lizenzdatei (XML oder JSON)
-    lizenz_dateipfad = "license.xml"
+    lizenz_dateipfad = LICENSE_FILE
     
-    # if --gettoken is provided get a new token
-    if args.gettoken:
-        # Token abrufen
-        token = token_abrufen(lizenz_dateipfad)
-        
-        if token:
-            print(f"Token erfolgreich abgerufen: {token}")
-            print("Sie können dieses Token jetzt für authentifizierte API-Anfragen verwenden.")
-            print("Das Token ist 20 Minuten gültig.")
-        else:
-            print("Fehler beim Abrufen eines gültigen Tokens.")
- 
-    # if --getbenchmarks is provided get the benchmarks list
-    elif args.getbenchmarks:
-        # Token abrufen
-        token = token_abrufen(lizenz_dateipfad)
-        
-        if token:
-            print(f"Token erfolgreich abgerufen: {token}")
-            print("Sie können dieses Token jetzt für authentifizierte API-Anfragen verwenden.")
-            print("Das Token ist 20 Minuten gültig.")
-            # Benchmark-Liste abrufen (öffentlicher Endpunkt)
-            list_available_benchmarks(ausfuehrlich=True, token=token)
-            
-        else:
-            print("Fehler beim Abrufen eines gültigen Tokens.")
-    elif args.getdetails:
-        # Token abrufen
-        token = token_abrufen(lizenz_dateipfad)
+    def download_liste(token):
+        workbench_ids = ids_aus_datei_lesen(args.download_list)
+        if workbench_ids:
+            download_benchmarks(workbench_ids, token)
+    
+    # Zuordnung der Optionen zu (Token erforderlich, Aktion); die erste gesetzte Option wird ausgeführt
+    aktionen = {
+        # Token abrufen und damit die Validität der Lizenz überprüfen
+        'gettoken': (True, lambda token: None),
+        # Benchmark-Liste abrufen (öffentlicher Endpunkt, benötigt kein Token)
+        'getbenchmarks': (False, lambda token: list_available_benchmarks(ausfuehrlich=True, token=token, formatiert=args.pretty)),
+        'getdetails': (True, lambda token: get_benchmark_details(args.getdetails, token)),
+        'download': (True, lambda token: download_benchmark(args.download, token)),
+        # Alle Benchmarks aus der Liste parallel herunterladen
+        'download_list': (True, download_liste),
+    }
+    
+    for option, (token_erforderlich, aktion) in aktionen.items():
+        if not getattr(args, option):
+            continue
         
-        if token:
+        token = None
+        if token_erforderlich:
+            token = token_abrufen(lizenz_dateipfad)
+            if not token:
+                print("Fehler beim Abrufen eines gültigen Tokens.")
+                break
             print(f"Token erfolgreich abgerufen: {token}")
             print("Sie können dieses Token jetzt für authentifizierte API-Anfragen verwenden.")
             print("Das Token ist 20 Minuten gültig.")
-            # Benchmark-Details abrufen (öffentlicher Endpunkt)
-            get_benchmark_details(args.getdetails, token)
-            
-        else:
-            print("Fehler beim Abrufen eines gültigen Tokens.")
-            
-    elif args.download:
-        # Token abrufen
-        token = token_abrufen(lizenz_dateipfad)
         
-        if token:
-            print(f"Token erfolgreich abgerufen: {token}")
-            print("Sie können dieses Token jetzt für authentifizierte API-Anfragen verwenden.")
-            print("Das Token ist 20 Minuten gültig.")
-            # Benchmark-Details abrufen (öffentlicher Endpunkt)
-            download_benchmark(args.download, token)
-            
-        else:
-            print("Fehler beim Abrufen eines gültigen Tokens.")
+        aktion(token)
+        break
 
 
 if __name__ == "__main__":